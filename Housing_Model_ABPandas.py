@@ -1,14 +1,44 @@
 import abpandas as abp
 import random
-import copy
 import numpy as np
 from statistics import median, mean
 from tqdm import tqdm
 from typing import Union, List
+from types import SimpleNamespace
+from dataclasses import dataclass, asdict
 import os
 import multiprocessing as mp
 
 python_directory = os.path.dirname(os.path.realpath(__file__))
+
+# codes of the house, household and market types (compared on every market sweep, so stored as ints rather than strings)
+MORTGAGE = 1
+RENT = 2
+BUY_TO_LET = 3      # market type only
+
+# codes of the transaction types kept in the records
+TRANSACTION_SALE = 0
+TRANSACTION_RENT = 1
+TRANSACTION_UNKNOWN = 2
+
+
+def median_of_few(values:list):
+    """
+    Median of a short list (skips the sort of statistics.median for the one or two houses most owners have)
+
+    Parameters
+    ----------
+    values: list of numbers
+
+    Return
+    ------
+    the median of the values
+    """
+    if len(values) == 1:
+        return values[0]
+    if len(values) == 2:
+        return (values[0] + values[1]) / 2
+    return median(values)
      
 
 class House(abp.Agent):
@@ -21,7 +51,7 @@ class House(abp.Agent):
 
         if properties == "default":
             self.props = {
-                "my_type": None,            # type of house; owned or rented
+                "my_type": None,            # type of house; MORTGAGE (owned) or RENT (rented)
                 "local_realtors": list(),   # the local realtors of the house
                 "end_of_life": 0,           # time step when this house will be demolished
                 "for_sale?": True,           # whether this house is currently for sale or rent
@@ -71,12 +101,12 @@ class Household(abp.Agent):
                 "repayment": list(),                        # my mortgage repayment amount, at each tick
                 "my_rent": 0,                               # rent at each tick
                 "homeless": 0,                              # count of the number of periods that this household has been without a house
-                "my_type": None,                            # type of household, 1 for owned and 0 for rented
+                "my_type": None,                            # type of household, MORTGAGE for owned and RENT for rented
                 "made_offer_on": None,                      # house that this household wants to buy/rent
                 "date_of_acquire": 0,                       # when my-house was bought/rented
                 "my_ownership": list(),                     # houses I own
                 "on_market?": False,                        # currently on the market or not (myType depicts the type of the market I use)
-                "on_market_type": None,                     # type of market a buyer is on now
+                "on_market_type": None,                     # type of market a buyer is on now (MORTGAGE, RENT or BUY_TO_LET)
                 "propensity": random.uniform(0.0, 1.0),     # the probability I will invest in housing
                 "preferences": {
                     "rooms": 0.5,
@@ -84,6 +114,91 @@ class Household(abp.Agent):
                 }
             }
 
+class Records:
+
+    def __init__(self, capacity:int=64):
+        """
+        Columnar archive of transactions (indices match across all the columns)
+
+        Parameters
+        ----------
+        capacity: int, default=64
+            number of records allocated up front (doubled whenever it is full)
+        """
+        self.n_records = 0
+        self.columns = {
+            "house": np.empty(capacity, dtype=np.int64),        # location index of the house with a transaction
+            "sale_price": np.empty(capacity, dtype=float),      # sale_price of house
+            "rent_price": np.empty(capacity, dtype=float),      # rent_price of house
+            "transaction": np.empty(capacity, dtype=np.uint8),  # type of transaction (TRANSACTION_SALE, _RENT or _UNKNOWN)
+            "date": np.empty(capacity, dtype=np.int64),         # date of transaction
+        }
+
+    def __len__(self):
+        return self.n_records
+
+    def __getitem__(self, column:str):
+        """Return the filled part of a column"""
+        return self.columns[column][:self.n_records]
+
+    def append(self, house:int, sale_price:float, rent_price:float, transaction:int, date:int):
+        """
+        Add one record to the end of the archive
+
+        Parameters
+        ----------
+        house: int
+            location index of the house
+        sale_price: float
+        rent_price: float
+        transaction: int
+            TRANSACTION_SALE, TRANSACTION_RENT or TRANSACTION_UNKNOWN
+        date: int
+            date of the transaction (in ticks)
+        """
+        # double the capacity of all the columns if they are full
+        if self.n_records == len(self.columns["date"]):
+            for key, values in self.columns.items():
+                grown = np.empty(2 * len(values), dtype=values.dtype)
+                grown[:self.n_records] = values
+                self.columns[key] = grown
+        n = self.n_records
+        self.columns["house"][n] = house
+        self.columns["sale_price"][n] = sale_price
+        self.columns["rent_price"][n] = rent_price
+        self.columns["transaction"][n] = transaction
+        self.columns["date"][n] = date
+        self.n_records += 1
+
+    def keep(self, mask:np.ndarray):
+        """
+        Keep only the records where mask is True (the order of the kept records is preserved)
+
+        Parameters
+        ----------
+        mask: boolean array of length n_records
+        """
+        n_kept = int(np.count_nonzero(mask))
+        for values in self.columns.values():
+            values[:n_kept] = values[:self.n_records][mask]
+        self.n_records = n_kept
+
+    def drop_before(self, date:int):
+        """
+        Remove the records dated before date (records are appended in date order, so these are a prefix)
+
+        Parameters
+        ----------
+        date: int
+            oldest date to keep (in ticks)
+        """
+        n_old = int(np.searchsorted(self["date"], date, side="left"))
+        if n_old > 0:
+            for values in self.columns.values():
+                values[:self.n_records - n_old] = values[n_old:self.n_records]
+            self.n_records -= n_old
+
+
 class Realtor(abp.Agent):
 
     def __init__(self, properties="default"):
@@ -95,18 +210,53 @@ class Realtor(abp.Agent):
         if properties == "default":
             self.props = {
                 "locality_houses": list(),      # all the houses in the locality
-                "records": list(),              # record of transactions
-                # {                     
-                #     "house": list(),                # record of houses with a transaction(indices match sale_price and rent_price)
-                #     "sale_price": list(),           # sale_price of house
-                #     "rent_price": list(),           # rent_price of house
-                #     "date": list(),                 # date of transaction
-                # }
+                "records": Records(),           # record of transactions (house, sale_price, rent_price, transaction, date)
                 "mean_price": 0,                # mean_price of all locality houses
                 "mean_rent": 0,                 # mean_rent of all locality houses
             }
 
 
+@dataclass(slots=True)
+class Monitors:
+    """Model monitors (counts and summary statistics updated during each step)"""
+    medianPriceForSale: float = 0           # median Price Of Houses For Sale
+    medianPriceForRent: float = 0           # median Price Of Houses For Ren
+    nUpshocked: int = 0                     # total number of upshocked households
+    nDownshocked: int = 0                   # total number of downshocked households
+    nUpshockedSell: int = 0                 # number of households putting their house for sale because their income has risen
+    nDownshockedSell: int = 0               # number of households putting their house for sale because their income has dropped
+    nUpshockedRent: int = 0                 # number of households putting their house for rent because their income has risen
+    nDownshockedRent: int = 0               # number of households putting their house for rent because their income has dropped
+    nDiscouraged: int = 0                   # number of households who discouraged by homeless and leave the city
+    nDiscouragedRent: int = 0
+    nDiscouragedMortgage: int = 0
+    nDiscouragedBTL: int = 0
+    nExit: int = 0                          # number of households who naturally leave the city or cease to exist
+    nEntry: int = 0                         # number of households who naturally enter or born into the city
+    moves: int = 0                          # number of households moving in this step
+    nDemolished: int = 0                    # number of demolished house
+    nForceOutSell: int = 0                  # number of households whose repayment is greater than income and force to leave
+    nHouseholdsOffered: int = 0             # number of households who made an offer on a house (have enough money and have target to buy)
+    meanIncomeForceOutSell: float = 0       # cal the mean income of all households who are forced out due to low income to repay mortgage
+    nForceOutRent: int = 0                  # number of households whose repayment is greater than income and force to leave
+    meanIncomeForceOutRent: float = 0       # cal the mean income of all households who are forced out due to low income to repay mortgage
+    nForceInSell: int = 0                   # number of households forced to sell their house
+    meanIncomeForceInSell: float = 0        # cal the mean income of all households who are forced to sell their hous
+    nEvictedMortgage: int = 0               # number of evicted households of type mortgage
+    nEvictedRent: int = 0                   # number of evicted households of type rent
+    nEnterMarketMortgage: int = 0           # number of households entering the mortgage market
+    nEnterMarketRent: int = 0               # number of households entering the rent market
+    nEnterMarketBuyToLet: int = 0           # number of households entering the BTL market
+    nForceSell: int = 0                     # number of households forced to put one of their houses on the buy-to-let market
+    meanIncomeEvictedMortgage: float = 0    # mean income of evicted households of type mortgage
+    meanIncomeEvictedRent: float = 0        # mean income of evicted households of type ren
+    nEvictedMortgageOneHouse: int = 0       # number of evicted households of type mortgage while owning one house
+    nEvictedMortgageMoreHouses: int = 0     # number of evicted househoods of type mortgage while owning more than one hous
+    nHomeless: int = 0                      # number of households evicted from their houses (does not include households coming into the system as immigrants
+    nPoorMortgage: int = 0                  # number of relatively poor mortgage households
+    nNaturalExit: int = 0                   # number of households naturally exiting the system
+
+
 class HousingModel(abp.Model):
 
     def __init__(self, space, agents=[], inputs="default"):
@@ -164,47 +314,18 @@ class HousingModel(abp.Model):
         else:
             self.inputs = inputs
 
-        self.monitors = {   
-            "medianPriceForSale": 0,            # median Price Of Houses For Sale
-            "medianPriceForRent": 0,            # median Price Of Houses For Ren  
-            "nUpshocked": 0,                    # total number of upshocked households
-            "nDownshocked": 0,                  # total number of downshocked households
-            "nUpshockedSell": 0,                # number of households putting their house for sale because their income has risen
-            "nDownshockedSell": 0,              # number of households putting their house for sale because their income has dropped
-            "nUpshockedRent": 0,                # number of households putting their house for rent because their income has risen
-            "nDownshockedRent": 0,              # number of households putting their house for rent because their income has dropped   
-            "nDiscouraged": 0,                  # number of households who discouraged by homeless and leave the city
-            "nDiscouragedRent": 0,
-            "nDiscouragedMortgage": 0,
-            "nDiscouragedBTL": 0,
-            "nExit": 0,                         # number of households who naturally leave the city or cease to exist
-            "nEntry": 0,                        # number of households who naturally enter or born into the city
-            "moves": 0,                         # number of households moving in this step
-            "nDemolished": 0,                   # number of demolished house  
-            "nForceOutSell": 0,                 # number of households whose repayment is greater than income and force to leave
-            "nHouseholdsOffered": 0,            # number of households who made an offer on a house (have enough money and have target to buy)
-            "meanIncomeForceOutSell": 0,        # cal the mean income of all households who are forced out due to low income to repay mortgage
-            "nForceOutRent": 0,                 # number of households whose repayment is greater than income and force to leave
-            "meanIncomeForceOutRent": 0,        # cal the mean income of all households who are forced out due to low income to repay mortgage
-            "nForceInSell": 0,                  # number of households forced to sell their house
-            "meanIncomeForceInSell": 0,         # cal the mean income of all households who are forced to sell their hous 
-            "nEvictedMortgage": 0,              # number of evicted households of type mortgage
-            "nEvictedRent": 0,                  # number of evicted households of type rent
-            "nenterMarketMortgage": 0,          # number of households entering the mortgage market
-            "nEnterMarketRent": 0,              # number of households entering the rent market
-            "nEnterMarketBuyToLet": 0,          # number of households entering the BTL market
-            "nForceSell": 0,                    # number of households forced to put one of their houses on the buy-to-let market
-            "meanIncomeEvictedMortgage": 0,     # mean income of evicted households of type mortgage
-            "meanIncomeEvictedRent": 0,         # mean income of evicted households of type ren   
-            "nEvictedMortgageOneHouse": 0,      # number of evicted households of type mortgage while owning one house
-            "nEvictedMortgageMoreHouses": 0,    # number of evicted househoods of type mortgage while owning more than one hous   
-            "nHomeless": 0,                     # number of households evicted from their houses (does not include households coming into the system as immigrants
-            "nPoorMortgage": 0,                 # number of relatively poor mortgage households
-            "nNaturalExit": 0,                  # number of households naturally exiting the system
-        }
+        self.monitors = Monitors()
 
         # initialise a records variable
-        self.records = list()                   # all the records in the system
+        self.records = Records()                # all the records in the system
+
+        # registries of the houses currently on the market (dicts used as insertion-ordered sets, kept in sync with
+        # the for_sale?/for_rent? flags so the market sweeps do not rescan every house)
+        self.houses_for_sale = dict()
+        self.houses_for_rent = dict()
+        # houses put on the market during the current tick (cleared at the start of every tick)
+        self.new_for_sale = list()
+        self.new_for_rent = list()
 
 
     def initialise(self):
@@ -212,16 +333,65 @@ class HousingModel(abp.Model):
         # track the phase of the model (at setup or not)
         self.setup = True
         self.ticks = 0
-        # calculate the interest per tick
-        self.interest_per_tick = self.inputs["interest_rate"] / (self.inputs["ticks_per_year"] * 100)
+        # calculate the interest per tick and the constants derived from the inputs
+        self.update_derived_inputs()
+        # cache the centroid coordinates of the patches (the space does not change) to calculate distances in bulk
+        centroids = self.space.geometry.centroid
+        self.patch_x = centroids.x.to_numpy()
+        self.patch_y = centroids.y.to_numpy()
         # create realtors
         self.initialise_realtors()
         # create houses
         self.initialise_houses()
         # create households and update their surplus income
         self.initialise_households()
+        # register the houses left on the market at setup
+        for h in self.houses:
+            self.update_market_registry(h)
         self.setup = False
     
+    @property
+    def interest_per_tick(self):
+        """Interest rate per tick"""
+        return self._interest_per_tick
+
+    @interest_per_tick.setter
+    def interest_per_tick(self, value:float):
+        """Set the interest rate per tick and refresh the annuity factor derived from it"""
+        self._interest_per_tick = value
+        # the mortgage duration in ticks (from the inputs, so the rate can also be set before the initialisation)
+        self._mortgage_ticks = self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"]
+        # annuity factor 1 - (1 + r)^-n
+        self._annuity_factor = 1 - (1 + value) ** (- self._mortgage_ticks)
+
+    def update_derived_inputs(self):
+        """Calculate the interest per tick and the constants derived from the inputs (inputs can change between ticks)"""
+        # calculate the interest per tick (which refreshes the mortgage duration in ticks and the annuity factor)
+        self.interest_per_tick = self.inputs["interest_rate"] / (self.inputs["ticks_per_year"] * 100)
+        # convert the percentage inputs to unit fractions
+        self._c = SimpleNamespace(
+            tpy=self.inputs["ticks_per_year"],
+            density=self.inputs["density"] / 100,
+            owned_rent=self.inputs["owned_rent_percentage"] / 100,
+            occupancy=self.inputs["initial_occupancy"] / 100,
+            fully_paid=self.inputs["fully_paid_mortgage_owners"] / 100,
+            investors=self.inputs["investors"] / 100,
+            upgrade_tenancy=self.inputs["upgrade_tenancy"] / 100,
+            max_ltv=self.inputs["max_LTV"] / 100,
+            aff=self.inputs["affordability"] / 100,
+            capital_mortgage=self.inputs["capital_mortgage"] / 100,
+            capital_rent=self.inputs["capital_rent"] / 100,
+            wage_rise=self.inputs["wage_rise"] / 100,
+            savings=self.inputs["savings"] / 100,
+            savings_rent=self.inputs["savings_rent"] / 100,
+            construction_rate=self.inputs["house_construction_rate"] / 100,
+            entry_rate=self.inputs["entry_rate"] / 100,
+            exit_rate=self.inputs["exit_rate"] / 100,
+            min_price=self.inputs["min_price_percent"] / 100,
+            price_drop=self.inputs["price_drop_rate"] / 100,
+            rent_drop=self.inputs["rent_drop_rate"] / 100,
+        )
+
     def initialise_realtors(self):
         """Create realtors"""
         space_centre = self.index_at_ij(max(self.space["i"]) / 2, max(self.space["j"]) / 2)
@@ -242,40 +412,42 @@ class HousingModel(abp.Model):
         """Create houses"""
         ## calculate the number of houses and agents
         num_plots = len(self.space.index)
-        num_houses = int( (self.inputs["density"] / 100) * num_plots )
-        num_houses_m = int( (self.inputs["owned_rent_percentage"] / 100) * num_houses )
+        num_houses = int( self._c.density * num_plots )
+        num_houses_m = int( self._c.owned_rent * num_houses )
         num_houses_r = num_houses - num_houses_m
-        num_households = int( (self.inputs["initial_occupancy"] / 100) * num_houses )
+        num_households = int( self._c.occupancy * num_houses )
 
-        ## define the lifetime distribution for houses
-        lifetime_distribution = list(np.random.normal(
+        ## define the lifetime distribution for houses (consumed positionally: mortgage houses first, then rent houses)
+        lifetime_distribution = np.random.normal(
             loc=self.inputs["house_mean_lifetime"] * self.inputs["ticks_per_year"], # mean
-            scale=200, # standard deviation 
+            scale=200, # standard deviation
             size=num_houses # sample size
-            )) 
-        
+            )
+
+        ## draw the locations of all houses at once from the patches with no agents
+        empty_indices = self.space.index[self.space["n_agents"].to_numpy() == 0].to_numpy()
+        np.random.shuffle(empty_indices)
+
         # mortgage houses
         print(f"Initialising {num_houses_m} mortgage houses")
         # create empty tracking variables for the mortgage houses
         self.space["mortgage_houses"] = [0 for i in range(len(self.space.index))]
         self.mortgage_houses = list()
-        
+
         for i in tqdm(range(num_houses_m)):
             # create house and assign its my_type to mortgage and its lifetime
             h = House()
-            h.props["my_type"] = "mortgage"
-            h_life = lifetime_distribution[i]
-            lifetime_distribution.remove(h_life)
-            h.props["end_of_life"] = int(h_life)
-            # find a random patch with no houses
-            h_loc_index = random.choice(self.space[self.space["n_agents"] == 0].index)
-            h_loc_index = int(h_loc_index)
+            h.props["my_type"] = MORTGAGE
+            h.props["end_of_life"] = int(lifetime_distribution[i])
+            # take the next random patch with no houses
+            h_loc_index = int(empty_indices[i])
             # add the house to the model
             self.add_agents(h, h_loc_index)
             self.space.at[h_loc_index, "mortgage_houses"] = h
             self.mortgage_houses.append(h)
-            # assign local realtor
-            self.assign_local_realtors(h)
+        # assign local realtors to all the mortgage houses at once
+        self.assign_local_realtors_bulk(self.mortgage_houses)
+        for h in self.mortgage_houses:
             self.record_to_realtor_locality(h)
         
         
@@ -287,109 +459,118 @@ class HousingModel(abp.Model):
         for i in tqdm(range(num_houses_r)):
             # create house and assign its my_type to rent
             h = House()
-            h.props["my_type"] = "rent"
-            h_life = random.choice(lifetime_distribution)
-            lifetime_distribution.remove(h_life)
-            h.props["end_of_life"] = int(h_life)
-            # find a random patch with no houses
-            h_loc_index = random.choice(self.space[self.space["n_agents"] == 0].index)
-            h_loc_index = int(h_loc_index)
+            h.props["my_type"] = RENT
+            h.props["end_of_life"] = int(lifetime_distribution[num_houses_m + i])
+            # take the next random patch with no houses
+            h_loc_index = int(empty_indices[num_houses_m + i])
             # add the house to the model
             self.add_agents(h, h_loc_index)
             self.space.at[h_loc_index, "rent_houses"] = h
             self.rent_houses.append(h)
-            # assign local realtor
-            self.assign_local_realtors(h)
+        # assign local realtors to all the rent houses at once
+        self.assign_local_realtors_bulk(self.rent_houses)
+        for h in self.rent_houses:
             self.record_to_realtor_locality(h)
     
     def initialise_households(self):
         n_total = len(self.houses)
-        n_mortgage = int(n_total * (self.inputs["owned_rent_percentage"] / 100) * (self.inputs["initial_occupancy"] / 100))
-        n_rent = int((n_total - n_mortgage) * (self.inputs["initial_occupancy"] / 100))
+        n_mortgage = int(n_total * self._c.owned_rent * self._c.occupancy)
+        n_rent = int((n_total - n_mortgage) * self._c.occupancy)
 
         income_distribution = np.random.normal(
             loc=self.inputs["mean_income"], # mean
             scale=self.inputs["mean_income"] / 6, # standard deviation 
             size=n_mortgage) # sample size
 
+        ## calculate the finances of all mortgage households at once
+        capital_distribution = income_distribution * self._c.capital_mortgage
+        max_repayment = (income_distribution * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
+        max_mortgage = np.minimum(
+            self._annuity_factor * (max_repayment / self.interest_per_tick),
+            (capital_distribution * self._c.max_ltv) / (1 - self._c.max_ltv)
+        )
+        repayment_distribution = max_mortgage * self.interest_per_tick / self._annuity_factor
+        deposit_distribution = max_mortgage * (100 / self.inputs["max_LTV"] - 1)
+        rate_duration_distribution = np.random.randint(self.inputs["min_rate_duration_M"], self.inputs["max_rate_duration_M"] + 1, size=n_mortgage)
+        propensity_distribution = np.random.uniform(0.0, 1.0, size=n_mortgage)
+
+        ## shuffle the (still unoccupied) houses once and take one per household
+        M_unoccupied_houses = list(self.mortgage_houses)
+        random.shuffle(M_unoccupied_houses)
+        R_unoccupied_houses = list(self.rent_houses)
+        random.shuffle(R_unoccupied_houses)
+
         # create households
         print(f"Initialising {n_mortgage} mortgage households")
         self.mortgage_households = list()
         self.space["mortgage_households"] = [0 for i in range(len(self.space.index))]
         for i in tqdm(range(n_mortgage)):
             hh = Household()
-            self.add_agent(hh, 0)
-            # find all mortgage unoccupied mortgage houses
-            temp = self.space[self.space["mortgage_houses"] != 0]
-            M_unoccupied_houses_df = temp[temp["n_households"] == 0]
-            selected_h = random.choice(list(M_unoccupied_houses_df["houses"]))
-            selected_h = selected_h[0]
+            # select a random unoccupied mortgage house
+            selected_h = M_unoccupied_houses.pop()
             # address household props
-            hh.props["my_type"] = "mortgage"
+            hh.props["my_type"] = MORTGAGE
             ## manage income and capital (surplus income will be updated at the end of this function)
-            hh.props["income"] = income_distribution[i]
+            hh.props["income"] = float(income_distribution[i])
             hh.props["income_surplus"] = hh.props["income"] / self.inputs["ticks_per_year"]
-            hh.props["capital"] = hh.props["income"] * (self.inputs["capital_mortgage"] / 100)
+            hh.props["capital"] = float(capital_distribution[i])
             ## assure the current house does not provide an income rent
             hh.props["income_rent"].append(0)
             ## address mortgage rate and duration
             hh.props["rate"].append(self.interest_per_tick)
-            hh.props["rate_duration"].append(random.randint(self.inputs["min_rate_duration_M"], self.inputs["max_rate_duration_M"]))
-            hh.props["mortgage_duration"].append(self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])
+            hh.props["rate_duration"].append(int(rate_duration_distribution[i]))
+            hh.props["mortgage_duration"].append(self._mortgage_ticks)
             ## address mortgage, repayment and deposit values
-            max_repayment = (hh.props["income"] * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
-            max_mortgage = min([
-                (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])) * (max_repayment / self.interest_per_tick),
-                (hh.props["capital"] * (self.inputs["max_LTV"] / 100)) / (1 - (self.inputs["max_LTV"] / 100))
-            ])
-            hh.props["mortgage"].append(max_mortgage)
-            hh.props["mortgage_initial"].append(max_mortgage)
-            hh.props["repayment"].append( (max_mortgage * self.interest_per_tick / (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"]))) )
-            hh.props["deposit"].append( max_mortgage * (100 / self.inputs["max_LTV"] - 1) )
+            hh_max_mortgage = float(max_mortgage[i])
+            hh.props["mortgage"].append(hh_max_mortgage)
+            hh.props["mortgage_initial"].append(hh_max_mortgage)
+            hh.props["repayment"].append(float(repayment_distribution[i]))
+            hh.props["deposit"].append(float(deposit_distribution[i]))
 
             ## address propensity
-            hh.props["propensity"] = random.uniform(0.0, 1.0)
+            hh.props["propensity"] = float(propensity_distribution[i])
             ## address the ownership and occupancy location of the household
             hh.props["my_ownership"].append(selected_h)
             hh.props["my_house"] = selected_h
-            self.move_agent(hh, selected_h.location_index)
+            ## add the household to the model directly at its house
+            self.add_agent(hh, selected_h.location_index)
             self.mortgage_households.append(hh)
             # address house props
             selected_h.props["my_owner"] = hh
             selected_h.props["my_occupier"] = hh
             selected_h.props["for_sale?"] = False
             selected_h.props["for_rent?"] = False
-            selected_h.props["sale_price"] = max_mortgage
+            selected_h.props["sale_price"] = hh_max_mortgage
             self.record_price(selected_h, record_sale=True)
 
         income_distribution = np.random.normal(
             loc=self.inputs["mean_income"], # mean
             scale=self.inputs["mean_income"] / 6, # standard deviation 
             size=n_rent # sample size
-            ) 
-        
+            )
+        ## draw the landlords and buy-to-let rate durations of all rent households at once
+        owner_choices = np.random.randint(0, len(self.mortgage_households), size=n_rent)
+        rate_duration_distribution = np.random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"] + 1, size=n_rent)
+
         print(f"Initialising {n_rent} rent households")
         self.rent_households = list()
         self.space["rent_households"] = [0 for i in range(len(self.space.index))]
         for i in tqdm(range(n_rent)):
             hh = Household()
-            # find all rent unoccupied mortgage houses
-            temp = self.space[self.space["rent_houses"] != 0]
-            R_unoccupied_houses_df = temp[temp["n_households"] == 0]
-            selected_h = random.choice(list(R_unoccupied_houses_df["houses"]))
-            selected_h = selected_h[0]
+            # select a random unoccupied rent house
+            selected_h = R_unoccupied_houses.pop()
             # address household props
-            hh.props["my_type"] = "rent"
+            hh.props["my_type"] = RENT
             hh.props["my_house"] = selected_h
             ## manage income and capital (surplus income will be updated at the end of this function)
             hh.props["income"] = income_distribution[i]
             hh.props["income_surplus"] = hh.props["income"] / self.inputs["ticks_per_year"]
-            hh.props["capital"] = hh.props["income"] * (self.inputs["capital_rent"] / 100)
+            hh.props["capital"] = hh.props["income"] * self._c.capital_rent
             ## manage rent
             hh.props["my_rent"] = (hh.props["income"] * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
             # address house props
             ## select a random owner
-            owner = random.choice(self.mortgage_households)
+            owner = self.mortgage_households[owner_choices[i]]
             ## assign owner and occupier to the house
             selected_h.props["my_owner"] = owner
             selected_h.props["my_occupier"] = hh
@@ -399,7 +580,7 @@ class HousingModel(abp.Model):
             selected_h.props["for_rent"] = False
             ## assign a price to the house
             repayment_temp = hh.props["my_rent"]
-            selected_h.props["sale_price"] = (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])) * (repayment_temp / self.interest_per_tick)
+            selected_h.props["sale_price"] = self._annuity_factor * (repayment_temp / self.interest_per_tick)
             selected_h.props["rent_price"] = hh.props["my_rent"]
             self.record_price(selected_h, record_rent=True)
             # address owner props
@@ -409,21 +590,23 @@ class HousingModel(abp.Model):
             owner.props["repayment"].append(repayment_temp)
             owner.props["income_rent"].append(selected_h.props["rent_price"])
             owner.props["rate"].append(self.interest_per_tick)
-            owner.props["rate_duration"].append(random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"]) * self.inputs["ticks_per_year"])
-            owner.props["mortgage_duration"].append(self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])
+            owner.props["rate_duration"].append(int(rate_duration_distribution[i]) * self.inputs["ticks_per_year"])
+            owner.props["mortgage_duration"].append(self._mortgage_ticks)
             ## add the household to the model
             self.add_agent(hh, selected_h.location_index)
             self.rent_households.append(hh)
         
         ## assign owners to houses available on the rent market but not occupied
-        # find all unoccupied mortgage houses
-        temp = self.space[self.space["rent_houses"] != 0]
-        R_unoccupied_houses_df = temp[temp["n_households"] == 0]
+        # the rent houses left in the shuffled list are the unoccupied ones
         rents = [self.rent_houses[i].props["rent_price"] for i in range(len(self.rent_houses)) if self.rent_houses[i].props["rent_price"] > 0]
-        for h in list(R_unoccupied_houses_df["houses"]):
-            # select house and owner
-            house = h[0]
-            owner = random.choice(self.mortgage_households)
+        # the rents of the occupied houses do not change in the loop below, so compute their median once (as before,
+        # this raises a StatisticsError if there are unoccupied rent houses but no rented house)
+        median_rent = median(rents) if len(R_unoccupied_houses) > 0 else 0
+        owner_choices = np.random.randint(0, len(self.mortgage_households), size=len(R_unoccupied_houses))
+        rate_duration_distribution = np.random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"] + 1, size=len(R_unoccupied_houses))
+        for i, house in enumerate(R_unoccupied_houses):
+            # select owner
+            owner = self.mortgage_households[owner_choices[i]]
             # address owner
             owner.props["my_ownership"].append(house)
             owner.props["mortgage"].append(owner.props["mortgage"][0])
@@ -431,26 +614,27 @@ class HousingModel(abp.Model):
             owner.props["repayment"].append(owner.props["repayment"][0])
             owner.props["income_rent"].append(0)
             owner.props["rate"].append(self.interest_per_tick)
-            owner.props["rate_duration"].append(random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"]) * self.inputs["ticks_per_year"])
-            owner.props["mortgage_duration"].append(self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])
+            owner.props["rate_duration"].append(int(rate_duration_distribution[i]) * self.inputs["ticks_per_year"])
+            owner.props["mortgage_duration"].append(self._mortgage_ticks)
             # address house
             house.props["my_owner"] = owner
             house.props["my_occupier"] = None
             house.props["rented_to"] = None
             house.props["sale_price"] = owner.props["my_house"].props["sale_price"]
-            house.props["rent_price"] = median(rents)
+            house.props["rent_price"] = median_rent
 
         ## fully pay for the mortgage of some mortgage households
         if self.inputs["fully_paid_mortgage_owners"] > 0:
-            hhs = random.sample(self.mortgage_households, int((self.inputs["fully_paid_mortgage_owners"] / 100) * len(self.rent_households)))
+            hhs = random.sample(self.mortgage_households, int(self._c.fully_paid * len(self.rent_households)))
             for hh in hhs:
-                for i in range(len(hh.props["my_ownership"])):
-                    hh.props["mortgage"][i] = 0
-                    hh.props["mortgage_initial"][i] = 0
-                    hh.props["mortgage_duration"][i] = None
-                    hh.props["repayment"][i] = 0
-                    hh.props["rate"][i] = 0
-                    hh.props["rate_duration"][i] = None
+                # clear the mortgages of all the owned houses at once
+                n_owned = len(hh.props["my_ownership"])
+                hh.props["mortgage"] = [0] * n_owned
+                hh.props["mortgage_initial"] = [0] * n_owned
+                hh.props["mortgage_duration"] = [None] * n_owned
+                hh.props["repayment"] = [0] * n_owned
+                hh.props["rate"] = [0] * n_owned
+                hh.props["rate_duration"] = [None] * n_owned
         
         self.update_surplus_income()
                 
@@ -477,26 +661,31 @@ class HousingModel(abp.Model):
         self.decay_prices()
         # update owners parameters (including surplus-income)
         self.update_owners()
-        print(f'Finishing step {self.ticks} | n_households = {len(self.households)}, n_houses = {len(self.houses)}, nEvictedRent = {self.monitors["nEvictedRent"]}, nDiscouragedRent = {self.monitors["nDiscouragedRent"]}, nDiscouragedMortgage = {self.monitors["nDiscouragedMortgage"]}, nEnterMortgage = {self.monitors["nEnterMarketMortgage"]}, nEnterBTL = {self.monitors["nEnterMarketBuyToLet"]}, nEnterMarketRent = {self.monitors["nEnterMarketRent"]}')
+        print(f'Finishing step {self.ticks} | n_households = {len(self.households)}, n_houses = {len(self.houses)}, nEvictedRent = {self.monitors.nEvictedRent}, nDiscouragedRent = {self.monitors.nDiscouragedRent}, nDiscouragedMortgage = {self.monitors.nDiscouragedMortgage}, nEnterMortgage = {self.monitors.nEnterMarketMortgage}, nEnterBTL = {self.monitors.nEnterMarketBuyToLet}, nEnterMarketRent = {self.monitors.nEnterMarketRent}')
         print("______________________________________________________")
 
     ## main step functions
     def update_globals(self):
         self.ticks += 1
-        self.interest_per_tick = self.inputs["interest_rate"] / (self.inputs["ticks_per_year"] * 100)
-        self.monitors["nDiscouraged"] = 0 
-        self.monitors["nDiscouragedRent"] = 0 
-        self.monitors["nDiscouragedMortgage"] = 0 
+        self.update_derived_inputs()
+        self.new_for_sale.clear()
+        self.new_for_rent.clear()
+        self.monitors.nDiscouraged = 0 
+        self.monitors.nDiscouragedRent = 0 
+        self.monitors.nDiscouragedMortgage = 0 
         for realtor in self.realtors:
-            prices_locality = [h.props["sale_price"] for h in realtor.props["locality_houses"] if h.props["sale_price"] > 0]
-            rents_locality = [h.props["rent_price"] for h in realtor.props["locality_houses"] if h.props["rent_price"] > 0]
-            if len(prices_locality) > 0: realtor.props["mean_price"] = mean(prices_locality)
-            if len(rents_locality) > 0: realtor.props["mean_rent"] = mean(rents_locality)
+            locality_houses = realtor.props["locality_houses"]
+            prices_locality = np.fromiter((h.props["sale_price"] for h in locality_houses), dtype=float, count=len(locality_houses))
+            rents_locality = np.fromiter((h.props["rent_price"] for h in locality_houses), dtype=float, count=len(locality_houses))
+            prices_locality = prices_locality[prices_locality > 0]
+            rents_locality = rents_locality[rents_locality > 0]
+            if prices_locality.size > 0: realtor.props["mean_price"] = float(prices_locality.mean())
+            if rents_locality.size > 0: realtor.props["mean_rent"] = float(rents_locality.mean())
 
     def manage_population_dynamics(self):
         """Manage random entry and exit of households"""
         # Exit
-        n_exit = int(len(self.households) * (self.inputs["exit_rate"] / 100))
+        n_exit = int(len(self.households) * self._c.exit_rate)
         # find all the households occupying a house
         occupying_hhs = [hh for hh in self.households if hh.props["my_house"] is not None]
         # select a random set of households to exit (make sure the sample selected is not larger than the number of households occupying houses)
@@ -510,25 +699,29 @@ class HousingModel(abp.Model):
                 self.evict(hh)
             self.remove_agent(hh)
         # monitor the number of households randomly exiting the system
-        self.monitors["nNaturalExit"] = len(exiting_hhs)
+        self.monitors.nNaturalExit = len(exiting_hhs)
         
         # Entry
-        n_enter = int(len(self.households) * (self.inputs["entry_rate"] / 100))
+        n_enter = int(len(self.households) * self._c.entry_rate)
         # generate a normal distribution for the entering households 
         income_distribution = np.random.normal(
             loc=self.inputs["mean_income"], # mean
             scale=self.inputs["mean_income"] / 6, # standard deviation 
             size=n_enter) # sample size
-        types = ["rent", "mortgage"]
+        ## draw the types of all the entering households at once and calculate their finances
+        types = [RENT, MORTGAGE]
+        type_distribution = np.random.randint(0, 2, size=n_enter)
+        surplus_distribution = income_distribution / self._c.tpy
+        capital_distribution = income_distribution * np.array([self._c.capital_rent, self._c.capital_mortgage])[type_distribution]
         for i in range(n_enter):
             hh = Household()
-            my_type = random.choice(types)
+            my_type = types[type_distribution[i]]
             hh.props["my_type"] = my_type
             self.enter_market(hh, my_type)
             ## manage income and capital
             hh.props["income"] = income_distribution[i]
-            hh.props["income_surplus"] = hh.props["income"] / self.inputs["ticks_per_year"]
-            hh.props["capital"] = hh.props["income"] * (self.inputs[f"capital_{my_type}"] / 100)
+            hh.props["income_surplus"] = surplus_distribution[i]
+            hh.props["capital"] = capital_distribution[i]
             ## add the agent to the model
             self.add_agent(hh)
 
@@ -538,32 +731,45 @@ class HousingModel(abp.Model):
         for hh in homeless_hhs:
             hh.props["homeless"] += 1
             if hh.props["homeless"] > self.inputs["max_homeless_period"]:
-                self.monitors["nDiscouraged"] += 1
-                if hh.props["on_market_type"] == "mortgage": self.monitors["nDiscouragedMortgage"] += 1
-                if hh.props["on_market_type"] == "buy-to-let": self.monitors["nDiscouragedBTL"] += 1
-                if hh.props["on_market_type"] == "rent": 
-                    self.monitors["nDiscouragedRent"] += 1
+                self.monitors.nDiscouraged += 1
+                if hh.props["on_market_type"] == MORTGAGE: self.monitors.nDiscouragedMortgage += 1
+                if hh.props["on_market_type"] == BUY_TO_LET: self.monitors.nDiscouragedBTL += 1
+                if hh.props["on_market_type"] == RENT: 
+                    self.monitors.nDiscouragedRent += 1
                     self.homeless_R_hhs.append(hh)
                 self.remove_agent(hh)
         
     def manage_market_participation(self):
-        occupying_hhs = [hh for hh in self.households if hh.props["my_house"] is not None]
-        # relatively poor households with my_type = mortgage
-        poor_mortgage = [
-            hh for hh in occupying_hhs \
-            if hh.props["on_market?"] == False \
-            and hh.props["my_type"] == "mortgage" \
-            and (sum(hh.props["repayment"]) * self.inputs["ticks_per_year"]) > (self.inputs["eviction_threshold_mortgage"] * (hh.props["income"] + (sum(hh.props["income_rent"]) * self.inputs["ticks_per_year"])) * (self.inputs["affordability"] / 100)) 
-            ]
+        tpy = self._c.tpy
+        aff = self._c.aff
+        max_ltv = self._c.max_ltv
+        threshold_mortgage = self.inputs["eviction_threshold_mortgage"]
+        affordability = self.inputs["affordability"]
+        threshold_rent = self.inputs["eviction_threshold_rent"]
+        threshold_savings = self.inputs["savings_to_price_threshold"]
+        interest_per_tick = self.interest_per_tick
+        annuity_factor = self._annuity_factor
+
+        # find the relatively poor occupying households that are not on the market in a single pass
+        occupying_hhs = list()
+        poor_mortgage = list()      # relatively poor households with my_type = mortgage
+        poor_rent = list()          # relatively poor households with my_type = rent
+        for hh in self.households:
+            props = hh.props
+            if props["my_house"] is None:
+                continue
+            occupying_hhs.append(hh)
+            if props["on_market?"] == True:
+                continue
+            if props["my_type"] == MORTGAGE:
+                if (sum(props["repayment"]) * tpy) > (threshold_mortgage * (props["income"] + (sum(props["income_rent"]) * tpy)) * aff):
+                    poor_mortgage.append(hh)
+            elif props["my_type"] == RENT:
+                if (props["my_rent"] * tpy) > (threshold_rent * props["income"] * affordability / 100):
+                    poor_rent.append(hh)
+
         # relatively poor mortgage households and only one house (these will be evicted)
         poor_mortgage_evict = [hh for hh in poor_mortgage if len(hh.props["my_ownership"]) <= 1]
-        # relatively poor rent households (these will always be evicted)
-        poor_rent = [
-            hh for hh in occupying_hhs \
-            if hh.props["on_market?"] == False \
-            and hh.props["my_type"] == "rent" \
-            and (hh.props["my_rent"] * self.inputs["ticks_per_year"]) > (self.inputs["eviction_threshold_rent"] * hh.props["income"] * self.inputs["affordability"] / 100)
-            ]
         # all relatively poor rent households with my_type = rent are to be evicted
         poor_rent_evict = poor_rent
         # union of all the households to be evicted
@@ -572,7 +778,7 @@ class HousingModel(abp.Model):
         # iterate through all the households to be evicted
         for hh in poor_evict:
             self.evict(hh)
-            self.enter_market(hh, "rent")
+            self.enter_market(hh, RENT)
         
         # relatively poor mortgage households with more than one house and without a house already on sale
         ## these will stay and will be forced to sell one house
@@ -586,94 +792,98 @@ class HousingModel(abp.Model):
         for hh in poor_mortgage_stay:
             self.force_sell(hh)
         
-        # relatively rich mortgage households
-        rich_mortgage = [
-            hh for hh in occupying_hhs \
-            if hh.props["my_type"] == "mortgage" \
-            and hh.props["on_market?"] == False \
-            and hh.props["capital"] > median(hh.props["mortgage"]) * (1 - (self.inputs["max_LTV"] / 100)) \
-            and ((hh.props["income"] + (sum(hh.props["income_rent"]) * self.inputs["ticks_per_year"])) - (sum(hh.props["repayment"]) * self.inputs["ticks_per_year"])) * (self.inputs["affordability"] / 100) > median(hh.props["repayment"]) * self.inputs["ticks_per_year"]
-        ]
-        # relatively rich rent households
-        rich_rent = [
-            hh for hh in occupying_hhs \
-            if hh.props["my_type"] == "rent" \
-            and hh.props["on_market?"] == False \
-            and hh.props["capital"] > (self.inputs["savings_to_price_threshold"] * hh.props["my_house"].props["sale_price"] * (1 - (self.inputs["max_LTV"] / 100))) \
-            and hh.props["income"] * (self.inputs["affordability"] / 100) > hh.props["my_house"].props["sale_price"] * (self.inputs["max_LTV"] / 100) * self.interest_per_tick / (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"]))
-        ]
-        # assure no household is considered both poor and rich (only occurs due to user input errors)
-        rich_mortgage = list(set(rich_mortgage) - set(poor_mortgage))
-        rich_rent = list(set(rich_rent) - set(poor_rent))
+        # relatively rich mortgage and rent households, found after the evictions and forced sales (these change the
+        # rental incomes of the landlords and put households on the market); a poor household is never considered rich
+        # (only occurs due to user input errors)
+        poor_mortgage_set = set(poor_mortgage)
+        poor_rent_set = set(poor_rent)
+        rich_mortgage = list()      # relatively rich households with my_type = mortgage
+        rich_rent = list()          # relatively rich households with my_type = rent
+        for hh in occupying_hhs:
+            props = hh.props
+            if props["on_market?"] == True:
+                continue
+            if props["my_type"] == MORTGAGE and hh not in poor_mortgage_set:
+                repayment_year = sum(props["repayment"]) * tpy
+                income_year = props["income"] + (sum(props["income_rent"]) * tpy)
+                if props["capital"] > median_of_few(props["mortgage"]) * (1 - max_ltv) \
+                and (income_year - repayment_year) * aff > median_of_few(props["repayment"]) * tpy:
+                    rich_mortgage.append(hh)
+            elif props["my_type"] == RENT and hh not in poor_rent_set:
+                house_price = props["my_house"].props["sale_price"]
+                if props["capital"] > (threshold_savings * house_price * (1 - max_ltv)) \
+                and props["income"] * aff > house_price * max_ltv * interest_per_tick / annuity_factor:
+                    rich_rent.append(hh)
 
         for hh in rich_mortgage:
-            if hh.props["propensity"] >= 1 - (self.inputs["investors"] / 100):
-                self.enter_market(hh, "buy-to-let")
+            if hh.props["propensity"] >= 1 - self._c.investors:
+                self.enter_market(hh, BUY_TO_LET)
         
         rich_rent_rent = list()
         for hh in rich_rent:
-            if hh.props["propensity"] >= 1 - (self.inputs["upgrade_tenancy"] / 100):
-                self.enter_market(hh, "rent")
+            if hh.props["propensity"] >= 1 - self._c.upgrade_tenancy:
+                self.enter_market(hh, RENT)
                 rich_rent_rent.append(hh)
             else:
-                self.enter_market(hh, "mortgage")
+                self.enter_market(hh, MORTGAGE)
         
         # manage globals
-        self.monitors["nPoorMortgage"] = len(poor_mortgage)
-        self.monitors["nEvictedMortgage"] = len(poor_mortgage_evict)
-        self.monitors["nEnterMarketRent"] = len(poor_evict) + len(rich_rent_rent)
-        self.monitors["nHomeless"] = len(poor_evict)
-        self.monitors["nEnterMarketMortgage"] = len(rich_rent)
-        self.monitors["nEnterMarketBuyToLet"] = len(rich_mortgage)
-        self.monitors["nForceSell"] = len(poor_mortgage_stay)
-        self.monitors["nEvictedRent"] = len(poor_rent_evict)
+        self.monitors.nPoorMortgage = len(poor_mortgage)
+        self.monitors.nEvictedMortgage = len(poor_mortgage_evict)
+        self.monitors.nEnterMarketRent = len(poor_evict) + len(rich_rent_rent)
+        self.monitors.nHomeless = len(poor_evict)
+        self.monitors.nEnterMarketMortgage = len(rich_rent)
+        self.monitors.nEnterMarketBuyToLet = len(rich_mortgage)
+        self.monitors.nForceSell = len(poor_mortgage_stay)
+        self.monitors.nEvictedRent = len(poor_rent_evict)
         if len(poor_mortgage_evict) > 0:
-            self.monitors["meanIncomeEvictedMortgage"] = mean([hh.props["income"] for hh in poor_mortgage_evict])
+            self.monitors.meanIncomeEvictedMortgage = mean([hh.props["income"] for hh in poor_mortgage_evict])
         else:
-            self.monitors["meanIncomeEvictedMortgage"] = 0
+            self.monitors.meanIncomeEvictedMortgage = 0
         if len(poor_rent_evict) > 0:
-            self.monitors["meanIncomeEvictedRent"] = mean([hh.props["income"] for hh in poor_rent_evict])
+            self.monitors.meanIncomeEvictedRent = mean([hh.props["income"] for hh in poor_rent_evict])
         else:
-            self.monitors["meanIncomeEvictedRent"] = 0
+            self.monitors.meanIncomeEvictedRent = 0
 
     def construct_houses(self):
-        n_construct = int(len(self.houses) * (self.inputs["house_construction_rate"] / 100))
-        lifetime_distribution = list(np.random.normal(
+        n_construct = int(len(self.houses) * self._c.construction_rate)
+        lifetime_distribution = np.random.normal(
             loc=(self.inputs["house_mean_lifetime"] * self.inputs["ticks_per_year"]) + self.ticks, # mean
             scale=200, # standard deviation 
             size=n_construct # sample size
-        ))
+        ).astype(np.int64)
+        # find the vacant plots once and draw distinct plots for all the new houses (as many as there are vacant plots)
+        vacant_plots = self.space.index[self.space["n_houses"].to_numpy() == 0].to_numpy()
+        selected_plots = np.random.choice(vacant_plots, size=min(n_construct, len(vacant_plots)), replace=False)
         # construct a number of new houses
         self.constructed_houses = list()
-        for i in range(n_construct):
-            # find the current vacant plorts
-            vacant_plots = self.space[self.space["n_houses"] == 0]
-            
-            # if there are any vacant plots, randomly choose a vacant plot and construct the house
-            if len(vacant_plots) > 0:
-                # find a vacant plot index
-                vacant_i = random.choice(vacant_plots.index)
-                # create house, define its type and its lifetime
-                house = House()
-                house.props["my_type"] = "mortgage"
-                house_life = lifetime_distribution[i]
-                house.props["end_of_life"] = int(house_life)
-                # add the house to the model
-                self.add_agent(house, vacant_i)
-                self.put_on_market(house)
-                # assign local realtor
-                self.assign_local_realtors(house)
-                self.record_to_realtor_locality(house)
-                self.constructed_houses.append(house)
-            else:
-                break
+        for i in range(len(selected_plots)):
+            vacant_i = int(selected_plots[i])
+            # create house, define its type and its lifetime
+            house = House()
+            house.props["my_type"] = MORTGAGE
+            house.props["end_of_life"] = int(lifetime_distribution[i])
+            # add the house to the model (this also updates the n_houses of the plot)
+            self.add_agent(house, vacant_i)
+            self.put_on_market(house)
+            self.constructed_houses.append(house)
+        # assign local realtors to all the new houses at once
+        self.assign_local_realtors_bulk(self.constructed_houses)
+        for house in self.constructed_houses:
+            self.record_to_realtor_locality(house)
 
     def trade_houses(self):
-        houses_for_sale = [h for h in self.houses if h.props["for_sale?"] == True]
-        houses_for_rent = [h for h in self.houses if h.props["for_rent?"] == True]
-
-        houses_for_sale_new = [h for h in houses_for_sale if h.props["date_for_sale"] == self.ticks]
-        houses_for_rent_new = [h for h in houses_for_rent if h.props["date_for_rent"] == self.ticks]
+        # read the houses on the market from the registries, in the order of self.houses (agent ids increase with creation)
+        houses_for_sale = sorted(self.houses_for_sale, key=lambda h: h.id)
+        houses_for_rent = sorted(self.houses_for_rent, key=lambda h: h.id)
+
+        # houses put on the market this tick and still on it (a house can be listed more than once or taken off again)
+        houses_for_sale_new = sorted(
+            (h for h in dict.fromkeys(self.new_for_sale) if h.props["for_sale?"] == True), key=lambda h: h.id
+        )
+        houses_for_rent_new = sorted(
+            (h for h in dict.fromkeys(self.new_for_rent) if h.props["for_rent?"] == True), key=lambda h: h.id
+        )
         
         # value houses newly added to the market
         for house in houses_for_sale_new:
@@ -684,27 +894,45 @@ class HousingModel(abp.Model):
         prices_on_market = [h.props["sale_price"] for h in houses_for_sale]
         rents_on_market = [h.props["rent_price"] for h in houses_for_rent]
         if len(prices_on_market) > 0: 
-            self.monitors["medianPriceForSale"] = median(prices_on_market)
+            self.monitors.medianPriceForSale = median(prices_on_market)
         else:
-            self.monitors["medianPriceForSale"] = 0
+            self.monitors.medianPriceForSale = 0
         if len(rents_on_market) > 0:
-            self.monitors["medianPriceForRent"] = median(rents_on_market)
+            self.monitors.medianPriceForRent = median(rents_on_market)
         else:
-            self.monitors["medianPriceForRent"] = 0
+            self.monitors.medianPriceForRent = 0
+
+        # sort the prices of the houses on the market once (prices do not change while offers are made) so the houses
+        # within the price range of each buyer can be found with a binary search
+        sale_prices = np.array(prices_on_market, dtype=float)
+        rent_prices = np.array(rents_on_market, dtype=float)
+        sale_order = np.argsort(sale_prices, kind="stable")
+        rent_order = np.argsort(rent_prices, kind="stable")
+        sorted_sale_prices = sale_prices[sale_order]
+        sorted_rent_prices = rent_prices[rent_order]
+
+        # bind the tick-invariant inputs used by every buyer to locals
+        affordability = self.inputs["affordability"]
+        tpy = self._c.tpy
+        max_ltv = self._c.max_ltv
+        limit_ltv = self.inputs["max_LTV"] < 100
+        interest_per_tick = self.interest_per_tick
+        annuity_factor = self._annuity_factor
+        search_length = self.inputs["buyer_search_length"]
 
         # make offers
         buyers = [hh for hh in self.households if hh.props["on_market?"] == True]
-        buyers_mortgage = [b for b in buyers if b.props["on_market_type"] == "mortgage"]
-        buyers_BTL = [b for b in buyers if b.props["on_market_type"] == "buy-to-let"]
-        buyers_rent = [b for b in buyers if b.props["on_market_type"] == "rent"]
+        buyers_mortgage = [b for b in buyers if b.props["on_market_type"] == MORTGAGE]
+        buyers_BTL = [b for b in buyers if b.props["on_market_type"] == BUY_TO_LET]
+        buyers_rent = [b for b in buyers if b.props["on_market_type"] == RENT]
 
         for buyer in buyers:
             # make offer mortgage
-            if buyer.props["on_market_type"] == "mortgage":
+            if buyer.props["on_market_type"] == MORTGAGE:
                 
                 # make-offer-mortgage
-                new_repayment = (buyer.props["income"] * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
-                new_mortgage = (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])) * (new_repayment / self.interest_per_tick)
+                new_repayment = (buyer.props["income"] * affordability) / (tpy * 100)
+                new_mortgage = annuity_factor * (new_repayment / interest_per_tick)
                 budget = new_mortgage
                 deposit = buyer.props["capital"]
                 current_house = buyer.props["my_house"]
@@ -718,10 +946,10 @@ class HousingModel(abp.Model):
                 
                 # update upper bound and stop if it is 0 or less
                 upperbound = budget + deposit
-                if self.inputs["max_LTV"] < 100:
+                if limit_ltv:
                     upperbound = min([
                         budget + deposit,
-                        deposit / (1 - (self.inputs["max_LTV"] / 100))
+                        deposit / (1 - max_ltv)
                     ])
                 
                 if upperbound <= 0:
@@ -733,33 +961,34 @@ class HousingModel(abp.Model):
                 # calculate lowerbound
                 lowerbound = upperbound * 0.7
 
-                # find all the interesting houses
+                # find all the interesting houses (in the price range, not offered to anyone and not owned by the buyer)
+                own_set = set(current_ownership)
+                own_set.add(current_house)
+                # houses with lowerbound < sale_price <= upperbound, back in the order of houses_for_sale
+                in_range = np.sort(sale_order[
+                    np.searchsorted(sorted_sale_prices, lowerbound, side="right"):np.searchsorted(sorted_sale_prices, upperbound, side="right")
+                ])
                 interesting_houses = [
-                    h for h in houses_for_sale \
-                    if h.props["offered_to"] is None \
-                    and h.props["sale_price"] <= upperbound \
-                    and h.props["sale_price"] > lowerbound \
-                    and h != current_house \
-                    and h not in current_ownership
+                    houses_for_sale[j] for j in in_range \
+                    if houses_for_sale[j].props["offered_to"] is None \
+                    and houses_for_sale[j] not in own_set
                     ]
                 # apply bounded rationality
-                if len(interesting_houses) > self.inputs["buyer_search_length"]:
-                    interesting_houses = random.sample(interesting_houses, self.inputs["buyer_search_length"])
+                if len(interesting_houses) > search_length:
+                    interesting_houses = random.sample(interesting_houses, search_length)
 
                 # select a house and make an offer
                 if len(interesting_houses) > 0:
-                    prices = [h.props["sale_price"] for h in interesting_houses]
-                    selected_price = max(prices)
-                    i = prices.index(selected_price)
-                    selected_h = interesting_houses[i]
+                    # the most expensive house (the first one found if there is a tie)
+                    selected_h = max(interesting_houses, key=lambda h: h.props["sale_price"])
                     selected_h.props["offered_to"] = buyer
                     selected_h.props["offer_date"] = self.ticks
                     buyer.props["made_offer_on"] = selected_h
 
             # make offer buy-to-let
-            if buyer.props["on_market_type"] == "buy-to-let":
-                new_repayment = (buyer.props["income"] * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
-                new_mortgage = (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])) * (new_repayment / self.interest_per_tick)
+            if buyer.props["on_market_type"] == BUY_TO_LET:
+                new_repayment = (buyer.props["income"] * affordability) / (tpy * 100)
+                new_mortgage = annuity_factor * (new_repayment / interest_per_tick)
                 budget = new_mortgage
                 deposit = buyer.props["capital"]
                 current_house = buyer.props["my_house"]
@@ -767,10 +996,10 @@ class HousingModel(abp.Model):
 
                 # update upper bound and stop if it is 0 or less
                 upperbound = budget + deposit
-                if self.inputs["max_LTV"] < 100:
+                if limit_ltv:
                     upperbound = min([
                         budget + deposit,
-                        deposit / (1 - (self.inputs["max_LTV"] / 100))
+                        deposit / (1 - max_ltv)
                     ])
                 
                 if upperbound <= 0:
@@ -780,56 +1009,57 @@ class HousingModel(abp.Model):
                 # calculate lowerbound
                 lowerbound = upperbound * 0.7
 
-                # find all the interesting houses
+                # find all the interesting houses (in the price range, not offered to anyone and not owned by the buyer)
+                own_set = set(current_ownership)
+                own_set.add(current_house)
+                # houses with lowerbound < sale_price <= upperbound, back in the order of houses_for_sale
+                in_range = np.sort(sale_order[
+                    np.searchsorted(sorted_sale_prices, lowerbound, side="right"):np.searchsorted(sorted_sale_prices, upperbound, side="right")
+                ])
                 interesting_houses = [
-                    h for h in houses_for_sale \
-                    if h.props["offered_to"] is None \
-                    and h.props["sale_price"] <= upperbound \
-                    and h.props["sale_price"] > lowerbound \
-                    and h != current_house \
-                    and h not in current_ownership
+                    houses_for_sale[j] for j in in_range \
+                    if houses_for_sale[j].props["offered_to"] is None \
+                    and houses_for_sale[j] not in own_set
                     ]
                 # apply bounded rationality
-                if len(interesting_houses) > self.inputs["buyer_search_length"]:
-                    interesting_houses = random.sample(interesting_houses, self.inputs["buyer_search_length"])
+                if len(interesting_houses) > search_length:
+                    interesting_houses = random.sample(interesting_houses, search_length)
 
                 # select a house and make an offer
                 if len(interesting_houses) > 0:
-                    prices = [h.props["sale_price"] for h in interesting_houses]
-                    selected_price = max(prices)
-                    i = prices.index(selected_price)
-                    selected_h = interesting_houses[i]
+                    # the most expensive house (the first one found if there is a tie)
+                    selected_h = max(interesting_houses, key=lambda h: h.props["sale_price"])
                     selected_h.props["offered_to"] = buyer
                     selected_h.props["offer_date"] = self.ticks
                     buyer.props["made_offer_on"] = selected_h
 
             # make offer rent
-            if buyer.props["on_market_type"] == "rent":
+            if buyer.props["on_market_type"] == RENT:
                 
                 # make-offer-rent
-                new_rent = (buyer.props["income"] * self.inputs["affordability"]) / (self.inputs["ticks_per_year"] * 100)
+                new_rent = (buyer.props["income"] * affordability) / (tpy * 100)
                 budget = new_rent
                 upperbound = budget
                 lowerbound = upperbound * 0.7
                 current_house = buyer.props["my_house"]
                 # find all the interesting houses
+                # houses with lowerbound < rent_price <= upperbound, back in the order of houses_for_rent
+                in_range = np.sort(rent_order[
+                    np.searchsorted(sorted_rent_prices, lowerbound, side="right"):np.searchsorted(sorted_rent_prices, upperbound, side="right")
+                ])
                 interesting_houses = [
-                    h for h in houses_for_rent \
-                    if h.props["offered_to"] is None \
-                    and h.props["rent_price"] <= upperbound \
-                    and h.props["rent_price"] > lowerbound \
-                    and h != current_house
+                    houses_for_rent[j] for j in in_range \
+                    if houses_for_rent[j].props["offered_to"] is None \
+                    and houses_for_rent[j] is not current_house
                     ]
                 # apply bounded rationality
-                if len(interesting_houses) > self.inputs["buyer_search_length"]:
-                    interesting_houses = random.sample(interesting_houses, self.inputs["buyer_search_length"])
+                if len(interesting_houses) > search_length:
+                    interesting_houses = random.sample(interesting_houses, search_length)
                 
                 # select a house and make an offer
                 if len(interesting_houses) > 0:
-                    prices = [h.props["rent_price"] for h in interesting_houses]
-                    selected_price = max(prices)
-                    i = prices.index(selected_price)
-                    selected_h = interesting_houses[i]
+                    # the most expensive house (the first one found if there is a tie)
+                    selected_h = max(interesting_houses, key=lambda h: h.props["rent_price"])
                     selected_h.props["offered_to"] = buyer
                     selected_h.props["offer_date"] = self.ticks
                     buyer.props["made_offer_on"] = selected_h
@@ -847,7 +1077,7 @@ class HousingModel(abp.Model):
                 new_house = hh.props["made_offer_on"]
 
                 # buyers on buy-to-let and mortgage market make a transaction
-                if hh.props["on_market_type"] == "mortgage" or hh.props["on_market_type"] == "buy-to-let":
+                if hh.props["on_market_type"] == MORTGAGE or hh.props["on_market_type"] == BUY_TO_LET:
                     buyer = hh
                     seller = new_house.props["my_owner"]
                     # manage the surplus of the surplus if it exists
@@ -857,7 +1087,7 @@ class HousingModel(abp.Model):
                     if seller is not None: self.manage_ownership_seller(seller, new_house)
 
                 # buyers on a rent market make a transaction
-                if hh.props["on_market_type"] == "rent":
+                if hh.props["on_market_type"] == RENT:
                     tenant = hh
                     landlord = new_house.props["my_owner"]
                     self.manage_surplus_landlord(landlord, new_house)
@@ -865,17 +1095,15 @@ class HousingModel(abp.Model):
                     self.manage_ownership_tenant(tenant)
 
     def manage_outdated_records(self):
+        cutoff = self.ticks - self.inputs["realtor_memory"]
         # loop through all the realtors
         for realtor in self.realtors:
-            # loop through all the records of the realtor
-            for record in realtor.props["records"]:
-                # if the record is too old, remove it from the list
-                if record["date"] < self.ticks - self.inputs["realtor_memory"]:
-                    realtor.props["records"].remove(record)
+            # keep only the records that are not too old
+            realtor.props["records"].drop_before(cutoff)
     
     def remove_offers(self):
         # find all the houses still on the market
-        houses_on_market = [h for h in self.houses if h.props["for_sale?"] == True or h.props["for_rent?"] == True]
+        houses_on_market = list(self.houses_for_sale) + list(self.houses_for_rent)
         # remove the houses from the market
         for house in houses_on_market:
             if house.props["offered_to"] is not None: house.props["offered_to"].props["made_offer_on"] = None
@@ -883,46 +1111,36 @@ class HousingModel(abp.Model):
             house.props["offer_date"] = 0
 
     def demolish_houses(self):
-        self.monitors["nDemolished"] = 0
+        self.monitors.nDemolished = 0
         
         # find the minimum rent and sale prices of houses on the market
-        min_sale_price = self.monitors["medianPriceForSale"] * (self.inputs["min_price_percent"] / 100)
-        min_rent_price = self.monitors["medianPriceForRent"] * (self.inputs["min_price_percent"] / 100)
-
-        # find all the mortgage and rent houses to be demolished
-        mortgage_houses_demolish = [
-            h for h in self.houses \
-            if h.props["my_type"] == "mortgage" \
-            and (self.ticks > h.props["end_of_life"] or (h.props["for_sale?"] == True and h.props["sale_price"] < min_sale_price))
-        ]
-        rent_houses_demolish = [
-            h for h in self.houses \
-            if h.props["my_type"] == "rent" \
-            and (self.ticks > h.props["end_of_life"] or (h.props["for_rent?"] == True and h.props["rent_price"] < min_rent_price))
-        ]
-        self.m_endOfLife = [
-            h for h in self.houses \
-            if h.props["my_type"] == "mortgage"
-            and self.ticks > h.props["end_of_life"]
-        ]
-        self.m_cheap = [
-            h for h in self.houses \
-            if h.props["my_type"] == "mortgage" \
-            and (h.props["for_sale?"] == True and h.props["sale_price"] < min_sale_price)
-        ]
-        self.r_endOfLife = [
-            h for h in self.houses \
-            if h.props["my_type"] == "rent"
-            and self.ticks > h.props["end_of_life"]
-        ]
-        self.r_cheap = [
-            h for h in self.houses \
-            if h.props["my_type"] == "rent" \
-            and (h.props["for_rent?"] == True and h.props["rent_price"] < min_rent_price)
-        ]
+        min_sale_price = self.monitors.medianPriceForSale * self._c.min_price
+        min_rent_price = self.monitors.medianPriceForRent * self._c.min_price
+
+        # find all the mortgage and rent houses to be demolished (at the end of their life or too cheap) in one pass
+        mortgage_houses_demolish = list()
+        rent_houses_demolish = list()
+        self.m_endOfLife = list()
+        self.m_cheap = list()
+        self.r_endOfLife = list()
+        self.r_cheap = list()
+        ticks = self.ticks
+        for h in self.houses:
+            props = h.props
+            end_of_life = ticks > props["end_of_life"]
+            if props["my_type"] == MORTGAGE:
+                cheap = props["for_sale?"] == True and props["sale_price"] < min_sale_price
+                if end_of_life: self.m_endOfLife.append(h)
+                if cheap: self.m_cheap.append(h)
+                if end_of_life or cheap: mortgage_houses_demolish.append(h)
+            elif props["my_type"] == RENT:
+                cheap = props["for_rent?"] == True and props["rent_price"] < min_rent_price
+                if end_of_life: self.r_endOfLife.append(h)
+                if cheap: self.r_cheap.append(h)
+                if end_of_life or cheap: rent_houses_demolish.append(h)
 
         # count the demolished houses
-        self.monitors["nDemolished"] = len(mortgage_houses_demolish) + len(rent_houses_demolish)
+        self.monitors.nDemolished = len(mortgage_houses_demolish) + len(rent_houses_demolish)
 
          # demolish the rent houses
         for house in rent_houses_demolish:
@@ -932,7 +1150,7 @@ class HousingModel(abp.Model):
             # if there is an occupier (i.e., tenant)
             if occupier is not None:
                 self.evict(occupier)
-                self.enter_market(occupier, "rent")
+                self.enter_market(occupier, RENT)
             # add the sale price to the capital of the owner after deducing the mortgage
             i = owner.props["my_ownership"].index(house)
             owner.props["capital"] = max([
@@ -942,15 +1160,10 @@ class HousingModel(abp.Model):
             # remove any offers made on the house
             if house.props["offered_to"] is not None: house.props["offered_to"].props["made_offer_on"] = None
             # manage the owner parameters
-            del owner.props["my_ownership"][i]
-            del owner.props["mortgage"][i]
-            del owner.props["mortgage_initial"][i]
-            del owner.props["mortgage_duration"][i]
-            del owner.props["repayment"][i]
-            del owner.props["income_rent"][i]
-            del owner.props["rate"][i]
-            del owner.props["rate_duration"][i]
+            self.drop_ownership_slot(owner, i)
             # remove the house from the model (demolish it)
+            self.houses_for_sale.pop(house, None)
+            self.houses_for_rent.pop(house, None)
             self.remove_agent(house)
             
 
@@ -968,7 +1181,7 @@ class HousingModel(abp.Model):
                     0
                 ])
                 self.evict(occupier)
-                self.enter_market(occupier, "mortgage")
+                self.enter_market(occupier, MORTGAGE)
             # if the house is for mortgage and for sale; i.e., there are two options: 
             ## (1) the owner put offered a previous rent house on the market as a type mortgage; 
             ## (2) the owner put his/her own my-house on the market
@@ -983,87 +1196,91 @@ class HousingModel(abp.Model):
                         0
                     ])
                     self.evict(occupier)
-                    self.enter_market(occupier, "mortgage")
+                    self.enter_market(occupier, MORTGAGE)
             # if the house has an owner but there is nobody occupying it (can happen if it was for rent and is now put on the mortgage market by a relatively poor household)
             if owner is not None and occupier is None:
                 i = owner.props["my_ownership"].index(house)
-                del owner.props["my_ownership"][i]
-                del owner.props["mortgage"][i]
-                del owner.props["mortgage_initial"][i]
-                del owner.props["mortgage_duration"][i]
-                del owner.props["repayment"][i]
-                del owner.props["income_rent"][i]
-                del owner.props["rate"][i]
-                del owner.props["rate_duration"][i]
+                self.drop_ownership_slot(owner, i)
             # remove the agent from the model
+            self.houses_for_sale.pop(house, None)
+            self.houses_for_rent.pop(house, None)
             self.remove_agent(house)
             
     def decay_prices(self):
-        houses_on_market = [
-            h for h in self.houses \
-            if (h.props["for_sale?"] == True and h.props["my_type"] == "mortgage") \
-            or (h.props["for_rent?"] == True and h.props["my_type"] == "rent")
-        ]
-        for house in houses_on_market:
-            house.props["sale_price"] = house.props["sale_price"] * (1 - (self.inputs["price_drop_rate"] / 100))
-            house.props["rent_price"] = house.props["rent_price"] * (1 - (self.inputs["rent_drop_rate"] / 100))
+        sale_factor = 1 - self._c.price_drop
+        rent_factor = 1 - self._c.rent_drop
+        # drop both prices of every house on the market (a house is only ever on one of the two registries)
+        for house in self.houses_for_sale:
+            if house.props["my_type"] == MORTGAGE:
+                house.props["sale_price"] *= sale_factor
+                house.props["rent_price"] *= rent_factor
+        for house in self.houses_for_rent:
+            if house.props["my_type"] == RENT:
+                house.props["sale_price"] *= sale_factor
+                house.props["rent_price"] *= rent_factor
 
     def update_owners(self):
         
-        owners = [
-            hh for hh in self.households \
-            if len(hh.props["my_ownership"]) > 0
-        ]
-
-        for owner in owners:
-            for i in range(len(owner.props["my_ownership"])):
-                owner.props["mortgage"][i] -= owner.props["repayment"][i]
-                if owner.props["mortgage"][i] <= 0:
-                    owner.props["mortgage"][i] = 0
-                    owner.props["repayment"][i] = 0
-                owner.props["capital"] += owner.props["income_surplus"] * (self.inputs["savings"] / 100)
+        interest_per_tick = self.interest_per_tick
+        annuity_factor = self._annuity_factor
+        savings = self._c.savings
+        savings_rent = self._c.savings_rent
+        min_rate_duration_M = self.inputs["min_rate_duration_M"]
+        max_rate_duration_M = self.inputs["max_rate_duration_M"]
+        min_rate_duration_BTL = self.inputs["min_rate_duration_BTL"]
+        max_rate_duration_BTL = self.inputs["max_rate_duration_BTL"]
+
+        # single pass over the households; owners pay off their mortgages, non owners (tenants and
+        # households on the rent or mortgage market) only save
+        for hh in self.households:
+            props = hh.props
+            n_owned = len(props["my_ownership"])
+            if n_owned == 0:
+                props["capital"] += props["income_surplus"] * savings_rent
+                continue
+
+            mortgage = props["mortgage"]
+            repayment = props["repayment"]
+            rate = props["rate"]
+            rate_duration = props["rate_duration"]
+            mortgage_duration = props["mortgage_duration"]
+            for i in range(n_owned):
+                mortgage[i] -= repayment[i]
+                if mortgage[i] <= 0:
+                    mortgage[i] = 0
+                    repayment[i] = 0
+                props["capital"] += props["income_surplus"] * savings
 
                 # address rate duration
                 ## if the fixed-rate agreement term ends and the household still has repayments
-                if owner.props["rate_duration"][i] == 0 and owner.props["repayment"][i] > 0:
+                if rate_duration[i] == 0 and repayment[i] > 0:
                     # if there is a new rate, calculate new repayment
-                    if owner.props["rate"][i] != self.interest_per_tick:
-                        total_mortgage = owner.props["mortgage_initial"][i]
-                        new_repayment = (total_mortgage * self.interest_per_tick) / (1- (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticke_per_year"]))
-                        owner.props["repayment"][i] = new_repayment
-                    owner.props["rate"][i] = self.interest_per_tick
+                    if rate[i] != interest_per_tick:
+                        total_mortgage = props["mortgage_initial"][i]
+                        repayment[i] = (total_mortgage * interest_per_tick) / annuity_factor
+                    rate[i] = interest_per_tick
                     # if this is the owner's home
                     if i == 0:
-                        owner.props["rate_duration"][i] = random.randint(self.inputs["min_rate_duration_M"], self.inputs["max_rate_duration_M"])
+                        rate_duration[i] = random.randint(min_rate_duration_M, max_rate_duration_M)
                     else:
-                        owner.props["rate_duration"][i] = random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"])
+                        rate_duration[i] = random.randint(min_rate_duration_BTL, max_rate_duration_BTL)
                     # subtract 1 tick from the rate duration and mortgage duration
-                    if owner.props["rate_duration"][i] is not None: owner.props["rate_duration"][i] -= 1
-                    if owner.props["mortgage_duration"][i] is not None: owner.props["mortgage_duration"][i] -= 1
-            self.update_income(owner)
-
-        # manage non owners (can be tenants and households on the rent or mortgage market)
-        non_owners = [
-            hh for hh in self.households \
-            if len(hh.props["my_ownership"]) == 0
-        ]
-
-        for hh in non_owners:
-            hh.props["capital"] += hh.props["income_surplus"] * (self.inputs["savings_rent"] / 100)
-            self.update_income(hh)
+                    if rate_duration[i] is not None: rate_duration[i] -= 1
+                    if mortgage_duration[i] is not None: mortgage_duration[i] -= 1
 
+        # update the surplus income and the income of all the households in one sweep
+        self.update_surplus_income()
 
     ## functions called within the main initialisation fucntions (and occasionally in step fucntions)
     def update_surplus_income(self):
+        """Update the surplus income (and the income after the setup) of all the households in one sweep"""
+        tpy = self._c.tpy
+        wage_factor = 1 + self._c.wage_rise
         for hh in self.households:
-            self.update_income(hh)
-
-    def update_income(self, household:Household):
-        hh = household
-        hh.props["income_surplus"] = (hh.props["income"] / self.inputs["ticks_per_year"]) + sum(hh.props["income_rent"]) - sum(hh.props["repayment"]) - hh.props["my_rent"]
-
-        if self.setup == False:
-            hh.props["income"] = hh.props["income"] * (1 + (self.inputs["wage_rise"] / 100))
+            props = hh.props
+            props["income_surplus"] = (props["income"] / tpy) + sum(props["income_rent"]) - sum(props["repayment"]) - props["my_rent"]
+            if self.setup == False:
+                props["income"] = props["income"] * wage_factor
 
 
 
@@ -1076,8 +1293,8 @@ class HousingModel(abp.Model):
         ----------
         agent: Household object or a list of Household objects
         """
-        # if the agent is of type "mortgage" (implies that the house is also "mortgage")
-        if agent.props["my_type"] == "mortgage":
+        # if the agent is of type MORTGAGE (implies that the house is also MORTGAGE)
+        if agent.props["my_type"] == MORTGAGE:
             # manage the house to be evicted
             my_house = agent.props["my_house"]
             my_house.props["my_occupier"] = None
@@ -1088,21 +1305,21 @@ class HousingModel(abp.Model):
             for house in agent.props["my_ownership"]:
                 if house != my_house:
                     # if my owned house is for rent
-                    if house.props["my_type"] == "rent":
+                    if house.props["my_type"] == RENT:
                         # if the house is occupied, evict the occupier
                         if house.props["my_occupier"] is not None:
                             occupier = house.props["my_occupier"]
                             self.evict(occupier)
-                            self.enter_market(occupier, "rent")
+                            self.enter_market(occupier, RENT)
                         # manage house props and put it on the market
-                        house.props["my_type"] = "mortgage"
+                        house.props["my_type"] = MORTGAGE
                         house.props["my_occupier"] = None
                         house.props["my_owner"] = None
                         house.props["rented_to"] = None
                         house.props["offered_to"] = None
                         self.put_on_market(house)
                     # if my owned house is of type mortgage (implies it is unoccupied)
-                    if house.props["my_type"] == "mortgage":
+                    if house.props["my_type"] == MORTGAGE:
                         # manage house props
                         house.props["my_occupier"] = None
                         house.props["my_owner"] = None
@@ -1119,8 +1336,8 @@ class HousingModel(abp.Model):
             agent.props["homeless"] = 0
             return True
         
-        # if the agent is of type "rent" (implies the house is also of type "rent")
-        if agent.props["my_type"] == "rent":
+        # if the agent is of type RENT (implies the house is also of type RENT)
+        if agent.props["my_type"] == RENT:
             # manage the house (put it back on the rent market)
             house = agent.props["my_house"]
             house.props["my_occupier"] = None
@@ -1146,16 +1363,19 @@ class HousingModel(abp.Model):
         ----------
         house: House object
         """
-        if house.props["my_type"] == "mortgage":
+        if house.props["my_type"] == MORTGAGE:
             house.props["for_sale?"] = True
             house.props["for_rent?"] = False
             house.props["offered_to"] = None
             house.props["date_for_sale"] = self.ticks
-        elif house.props["my_type"] == "rent":
+            self.new_for_sale.append(house)
+        elif house.props["my_type"] == RENT:
             house.props["for_sale?"] = False
             house.props["for_rent?"] = True
             house.props["offered_to"] = None
             house.props["date_for_rent"] = self.ticks
+            self.new_for_rent.append(house)
+        self.update_market_registry(house)
     
     def remove_from_market(self, house:House):
         """
@@ -1167,25 +1387,43 @@ class HousingModel(abp.Model):
         """
         house.props["for_sale?"] = False
         house.props["for_rent?"] = False
+        self.update_market_registry(house)
         if house.props["offered_to"] is not None:
             house.props["offered_to"].props["made_offer_on"] = None
         house.props["offered_to"] = None
         house.props["rented_to"] = None
         house.props["offer_date"] = 0
 
-    def enter_market(self, household:Household, market:str):
+    def update_market_registry(self, house:House):
+        """
+        Sync the for sale and for rent registries with the market flags of one house
+
+        Parameters
+        ----------
+        house: House object
+        """
+        if house.props["for_sale?"]:
+            self.houses_for_sale[house] = None
+        else:
+            self.houses_for_sale.pop(house, None)
+        if house.props["for_rent?"]:
+            self.houses_for_rent[house] = None
+        else:
+            self.houses_for_rent.pop(house, None)
+
+    def enter_market(self, household:Household, market:int):
         """
         Place a household on the housing market
         
         Parameters
         ----------
         household: Household agent
-        market: Market string ("mortgage" or "rent")
+        market: Market type code (MORTGAGE, RENT or BUY_TO_LET)
         """
         household.props["on_market?"] = True
         household.props["on_market_type"] = market
 
-    def leave_market(self, household:Household, market:str):
+    def leave_market(self, household:Household, market:int):
         """
         Remove a household from the housing market
         
@@ -1205,32 +1443,57 @@ class HousingModel(abp.Model):
         agent: Household agent
         """
         hh = household
-        # find the ownership excluding my house
-        my_ownership_b = [h for h in hh.props["my_ownership"] if h != hh.props["my_house"]]
-        # find the ownership that is vacant (not rented)
-        my_ownership_not_rented = [h for h in my_ownership_b if h.props["my_type"] == "rent" and h.props["my_occupier"] is None]
+        my_house = hh.props["my_house"]
+        # find the ownership (excluding my house) that is vacant (not rented)
+        my_ownership_not_rented = [
+            h for h in hh.props["my_ownership"] \
+            if h != my_house and h.props["my_type"] == RENT and h.props["my_occupier"] is None
+        ]
         # if there is any non rented houses, select one of them to sell (no need to evict an owner)
         if len(my_ownership_not_rented) > 0:
             h_to_sell = random.choice(my_ownership_not_rented)
-            h_to_sell.props["my_type"] = "mortgage"
+            h_to_sell.props["my_type"] = MORTGAGE
             self.put_on_market(h_to_sell)
         # if all the houses are rented, select the one that yields the highest surplus
         else:
-            # calculate the surplus profit from selling each house in my_ownership
-            surplus = [hh.props["my_ownership"][i].props["sale_price"] - hh.props["mortgage"][i] for i in range(len(household.props["my_ownership"]))]
-            # indicate the surplus from selling my_house is zero
-            surplus[hh.props["my_ownership"].index(hh.props["my_house"])] = 0
-            # select a house to sell
-            i_to_sell = surplus.index(max(surplus))
+            # select the house with the highest surplus profit from selling it in one pass over my_ownership
+            # (the surplus from selling my_house is taken as zero; the first house wins a tie)
+            mortgage = hh.props["mortgage"]
+            i_to_sell = 0
+            max_surplus = None
+            for i, h in enumerate(hh.props["my_ownership"]):
+                surplus = 0 if h == my_house else h.props["sale_price"] - mortgage[i]
+                if max_surplus is None or surplus > max_surplus:
+                    i_to_sell = i
+                    max_surplus = surplus
             h_to_sell = hh.props["my_ownership"][i_to_sell]
             # manage the occupier (since the house is rented to someone)
             occupier = h_to_sell.props["my_occupier"]
             self.evict(occupier)
-            self.enter_market(occupier, "rent")
+            self.enter_market(occupier, RENT)
             # put the house on the market
-            h_to_sell.props["my_type"] = "mortgage"
+            h_to_sell.props["my_type"] = MORTGAGE
             self.put_on_market(h_to_sell)
     
+    def patch_distances(self, loc_index:int, loc_indices):
+        """
+        Distances between the centroid of one patch and the centroids of many patches (same as Model.distance)
+
+        Parameters
+        ----------
+        loc_index: int
+            location index of the first patch
+        loc_indices: list or array of int
+            location indices of the other patches
+
+        Return
+        ------
+        array of distances (in the order of loc_indices)
+        """
+        dx = self.patch_x[loc_indices] - self.patch_x[loc_index]
+        dy = self.patch_y[loc_indices] - self.patch_y[loc_index]
+        return np.sqrt(dx * dx + dy * dy)
+
     def assign_local_realtors(self, house:House, loc_index:int = -1):
         """
         Find a local realtor
@@ -1241,21 +1504,35 @@ class HousingModel(abp.Model):
         loc_index: int, default -1
             at -1, the house location index uses is house.location_index
         """
-        # find the location index
-        if loc_index == -1:
-            h_loc_index = int(house.location_index)
-        else:
-            h_loc_index = int(loc_index)
-        dists_from_realtors = {}
-        # assign local realtor
-        for r_loc_index in self.realtors_indices:
-            dist_temp = self.distance(h_loc_index, r_loc_index)
-            dists_from_realtors[r_loc_index] = dist_temp
-            if dist_temp <= self.inputs["realtor_territory"]:
-                house.props["local_realtors"].append(self.space.at[r_loc_index, "realtors"][0])
-        if house.props["local_realtors"] == list():
-            r_loc_index_alternative = min(dists_from_realtors, key=dists_from_realtors.get)
-            house.props["local_realtors"].append(self.space.at[r_loc_index_alternative, "realtors"][0])
+        self.assign_local_realtors_bulk([house], None if loc_index == -1 else [loc_index])
+
+    def assign_local_realtors_bulk(self, houses:List[House], loc_indices:List[int] = None):
+        """
+        Find the local realtors of many houses with one distance sweep
+
+        Parameters
+        ----------
+        houses: list of House agents
+        loc_indices: list of int, default None
+            at None, the house location indices used are the houses' location_index
+        """
+        if len(houses) == 0: return
+        realtors = [self.space.at[r_loc_index, "realtors"][0] for r_loc_index in self.realtors_indices]
+        if loc_indices is None:
+            loc_indices = [h.location_index for h in houses]
+        h_loc_indices = np.array([int(loc_index) for loc_index in loc_indices])
+        r_loc_indices = np.array(self.realtors_indices)
+        # distances between every house (rows) and every realtor (columns)
+        dx = self.patch_x[h_loc_indices][:, None] - self.patch_x[r_loc_indices][None, :]
+        dy = self.patch_y[h_loc_indices][:, None] - self.patch_y[r_loc_indices][None, :]
+        dists = np.sqrt(dx * dx + dy * dy)
+        within_territory = dists <= self.inputs["realtor_territory"]
+        nearest = np.argmin(dists, axis=1)
+        for k, house in enumerate(houses):
+            house.props["local_realtors"].extend(realtors[j] for j in np.flatnonzero(within_territory[k]))
+            # if no realtor is within the territory, assign the nearest realtor
+            if house.props["local_realtors"] == list():
+                house.props["local_realtors"].append(realtors[nearest[k]])
 
     def record_to_realtor_locality(self, house:House):
         """
@@ -1281,28 +1558,25 @@ class HousingModel(abp.Model):
         record_rent: bool, default=False
             Record the rent of the house to its local realtors if True
         """
-        record = {}
+        if record_sale == True and record_rent == False:
+            sale_price = house.props["sale_price"]
+            rent_price = 0
+            transaction = TRANSACTION_SALE
+            #realtor.props["mean_price"] = mean([p for p in realtor.props["sale_price"] if p != 0])
+        elif record_sale == False and record_rent == True:
+            sale_price = 0
+            rent_price = house.props["rent_price"]
+            transaction = TRANSACTION_RENT
+            #realtor.props["mean_rent"] = mean([r for r in realtor.props["rent_price"] if r != 0])
+        else:
+            sale_price = house.props["sale_price"]
+            rent_price = house.props["rent_price"]
+            transaction = TRANSACTION_UNKNOWN
+            #realtor.props["mean_price"] = mean([p for p in realtor.props["sale_price"] if p != 0])
+            #realtor.props["mean_rent"] = mean([r for r in realtor.props["rent_price"] if r != 0])
         for realtor in house.props["local_realtors"]:
-            record["house"] = house
-            record["date"] = self.ticks
-            if record_sale == True and record_rent == False:
-                record["sale_price"] = house.props["sale_price"]
-                record["rent_price"] = 0
-                record["transaction"] = "sale"
-                #realtor.props["mean_price"] = mean([p for p in realtor.props["sale_price"] if p != 0])
-            elif record_sale == False and record_rent == True:
-                record["sale_price"] = 0
-                record["rent_price"] = house.props["rent_price"]
-                record["transaction"] = "rent"
-                #realtor.props["mean_rent"] = mean([r for r in realtor.props["rent_price"] if r != 0])
-            else:
-                record["sale_price"] = house.props["sale_price"]
-                record["rent_price"] = house.props["rent_price"]
-                record["transaction"] = "unknown"
-                #realtor.props["mean_price"] = mean([p for p in realtor.props["sale_price"] if p != 0])
-                #realtor.props["mean_rent"] = mean([r for r in realtor.props["rent_price"] if r != 0])
-            realtor.props["records"].append(record)
-        self.records.append(record)
+            realtor.props["records"].append(house.location_index, sale_price, rent_price, transaction, self.ticks)
+        self.records.append(house.location_index, sale_price, rent_price, transaction, self.ticks)
     
     def remove_record(self, house:House):
         """
@@ -1320,11 +1594,12 @@ class HousingModel(abp.Model):
         """
         status = False
         for realtor in house.props["local_realtors"]:
+            records = realtor.props["records"]
             # find all the records of the house in the realtor's records archive
-            house_records = [realtor.props["records"][r] for r in range(len(realtor.props["records"])) if realtor.props["records"][r]["house"] == house]
+            house_records = records["house"] == house.location_index
             # remove all the found records (if any)
-            for record in house_records:
-                realtor.props["records"].remove(record)
+            if house_records.any():
+                records.keep(~house_records)
                 status = True
         return status
 
@@ -1345,34 +1620,29 @@ class HousingModel(abp.Model):
         #normalisation = 1
         #multiplier = house.props["quality"] * ((1 + self.inputs["realtor_optimism"]) / 100) * normalisation
 
-        h_old_price = copy.deepcopy(house.props["sale_price"])
-        h_old_rent = copy.deepcopy(house.props["rent_price"])
-
         evaluation = list()
 
         if house.props["for_sale?"] == True:
             for realtor in house.props["local_realtors"]:
+                records = realtor.props["records"]
                 ## find the houses within both the locality of the input house and its realtor
-                local_sales = [
-                    realtor.props["records"][i]["sale_price"] for i in range(len(realtor.props["records"])) \
-                    if realtor.props["records"][i]["transaction"] == "sale" \
-                    and self.distance(house, realtor.props["records"][i]["house"]) <= self.inputs["locality"]
-                ]
-                if len(local_sales) > 0:
-                    evaluation.append(median(local_sales))
+                local = (records["transaction"] == TRANSACTION_SALE) \
+                    & (self.patch_distances(house.location_index, records["house"]) <= self.inputs["locality"])
+                local_sales = records["sale_price"][local]
+                if local_sales.size > 0:
+                    evaluation.append(float(np.median(local_sales)))
                 else:
                     evaluation.append(realtor.props["mean_price"])
             
         elif house.props["for_rent?"] == True:
             for realtor in house.props["local_realtors"]:
+                records = realtor.props["records"]
                 ## find the houses within both the locality of the input house and its realtor
-                local_rents = [
-                    realtor.props["records"][i]["rent_price"] for i in range(len(realtor.props["records"])) \
-                    if realtor.props["records"][i]["transaction"] == "rent" \
-                    and self.distance(house, realtor.props["records"][i]["house"]) <= self.inputs["locality"]
-                ]
-                if len(local_rents) > 0:
-                    evaluation.append(median(local_rents))
+                local = (records["transaction"] == TRANSACTION_RENT) \
+                    & (self.patch_distances(house.location_index, records["house"]) <= self.inputs["locality"])
+                local_rents = records["rent_price"][local]
+                if local_rents.size > 0:
+                    evaluation.append(float(np.median(local_rents)))
                 else:
                     evaluation.append(realtor.props["mean_rent"])
         return evaluation
@@ -1394,34 +1664,45 @@ class HousingModel(abp.Model):
             True: the chain is complete and the households in the chain should make the transactions
             False: the chain is not complete and the households in the chain should not make the transactions
         """
-        # if the household did not make any offer or is not on the market in the first place, False
-        if household.props["made_offer_on"] is None or household.props["on_market?"] == False: return False
-
-        # if the buyer is on the mortgage or buy-to-let market
-        if household.props["on_market_type"] == "mortgage" or household.props["on_market_type"] == "buy-to-let":
-            buyer = household
-            seller = buyer.props["made_offer_on"].props["my_owner"]
-            # if there is no seller (i.e., house is not owned), report a true chain
-            if seller is None: return True
-            # if the seller has more than one house (i.e., seller does not need to find another house to buy before the transaction), report a true chain
-            if len(seller.props["my_ownership"]) > 1: return True
-            # if the buyer is the same as the seller (i.e., they are exchanging their houses), True
-            if buyer == seller: return True
-            # if seller is the same as the first link in the change (i.e., there is a loop of exhcanges), True
-            if seller == first_household: return True
-            # else, meaning, if the seller has one house, check if the seller has a confirmed house to buy before making the transaction
-            return self.follow_chain(seller, first_household)
-        
-        # if the buyer is on the rent market
-        if household.props["on_market_type"] == "rent":
-            tenant = household
-            occupier = tenant.props["made_offer_on"].props["my_occupier"]
-            # if there is no occupier (i.e., the house is vacant and can be directly rented), True
-            if occupier is None: return True
-            # if the occupier of the house is the first household in the link
-            if occupier == first_household: return True
-            # else, meaning, if there is an occupier, check if that occupier found another house to rent or not before making the transaction
-            return self.follow_chain(occupier, first_household)
+        # walk along the chain one household at a time (iteratively, so long chains do not grow the call stack)
+        visited = set()
+        while True:
+            # if the household did not make any offer or is not on the market in the first place, False
+            if household.props["made_offer_on"] is None or household.props["on_market?"] == False: return False
+            # if the chain runs back into a household already checked, it is a loop of exchanges (like a loop back to
+            # the first household), True
+            if household in visited: return True
+            visited.add(household)
+
+            # if the buyer is on the mortgage or buy-to-let market
+            if household.props["on_market_type"] == MORTGAGE or household.props["on_market_type"] == BUY_TO_LET:
+                buyer = household
+                seller = buyer.props["made_offer_on"].props["my_owner"]
+                # if there is no seller (i.e., house is not owned), report a true chain
+                if seller is None: return True
+                # if the seller has more than one house (i.e., seller does not need to find another house to buy before the transaction), report a true chain
+                if len(seller.props["my_ownership"]) > 1: return True
+                # if the buyer is the same as the seller (i.e., they are exchanging their houses), True
+                if buyer == seller: return True
+                # if seller is the same as the first link in the change (i.e., there is a loop of exhcanges), True
+                if seller == first_household: return True
+                # else, meaning, if the seller has one house, check if the seller has a confirmed house to buy before making the transaction
+                household = seller
+
+            # if the buyer is on the rent market
+            elif household.props["on_market_type"] == RENT:
+                tenant = household
+                occupier = tenant.props["made_offer_on"].props["my_occupier"]
+                # if there is no occupier (i.e., the house is vacant and can be directly rented), True
+                if occupier is None: return True
+                # if the occupier of the house is the first household in the link
+                if occupier == first_household: return True
+                # else, meaning, if there is an occupier, check if that occupier found another house to rent or not before making the transaction
+                household = occupier
+
+            # the household is on no known market
+            else:
+                return False
 
     def manage_ownership_buyer(self, buyer:Household):
         """
@@ -1435,25 +1716,26 @@ class HousingModel(abp.Model):
         new_house = buyer.props["made_offer_on"]
         self.record_price(new_house, record_sale=True)
         # buyers on a mortgage market
-        if buyer.props["on_market_type"] == "mortgage":
+        if buyer.props["on_market_type"] == MORTGAGE:
             # manage the situation when a tenant is buying and moving from their current my_house
-            if current_house is not None and current_house.props["my_type"] == "rent":
+            if current_house is not None and current_house.props["my_type"] == RENT:
                 current_house.props["my_occupier"] = None
                 current_house.props["rented_to"] = None
                 current_house.props["offered_to"] = None
                 self.put_on_market(current_house)
         
             # manage the parameters of the new house and take it off the market
-            new_house.props["my_type"] = "mortgage"
+            new_house.props["my_type"] = MORTGAGE
             new_house.props["my_owner"] = buyer
             new_house.props["my_occupier"] = buyer
             new_house.props["rented_to"] = None
             new_house.props["offered_to"] = None
             new_house.props["for_sale?"] = False
             new_house.props["for_rent?"] = False
+            self.update_market_registry(new_house)
             # manage the parameters of the buyer
             buyer.props["homeless"] = 0
-            buyer.props["my_type"] = "mortgage"
+            buyer.props["my_type"] = MORTGAGE
             buyer.props["date_of_acquire"] = self.ticks
             buyer.props["my_house"] = new_house
             buyer.props["my_ownership"] = [new_house]
@@ -1464,18 +1746,18 @@ class HousingModel(abp.Model):
             self.move_agent(buyer, new_house.location_index)
         
         # buyers on a buy-to-let market
-        if buyer.props["on_market_type"] == "buy-to-let":
+        if buyer.props["on_market_type"] == BUY_TO_LET:
             # manage the parameters of the new house
-            new_house.props["my_type"] = "rent"
+            new_house.props["my_type"] = RENT
             new_house.props["my_owner"] = buyer
             new_house.props["my_occupier"] = None
             new_house.props["offered_to"] = None
             new_house.props["rented_to"] = None
             self.put_on_market(new_house)
-            new_house.props["rent_price"] = max([
-                max(self.evaluate(new_house)), 
-                buyer.props["repayment"][-1]
-                ])
+            # the rent is the highest valuation of the local realtors, but never below the repayment of the new mortgage
+            evaluation = self.evaluate(new_house)
+            evaluation.append(buyer.props["repayment"][-1])
+            new_house.props["rent_price"] = max(evaluation)
             # manage the parameters of the buyer
             buyer.props["my_ownership"].append(new_house)
             buyer.props["made_offer_on"] = None
@@ -1506,7 +1788,7 @@ class HousingModel(abp.Model):
         self.record_price(new_house, record_rent=True)
         # manage the parameters of the tenant
         tenant.props["homeless"] = 0
-        tenant.props["my_type"] = "rent"
+        tenant.props["my_type"] = RENT
         tenant.props["my_house"] = new_house
         tenant.props["my_rent"] = new_house.props["rent_price"]
         tenant.props["my_ownership"] = list()
@@ -1521,6 +1803,7 @@ class HousingModel(abp.Model):
         new_house.props["rented_to"] = tenant
         new_house.props["for_sale?"] = False
         new_house.props["for_rent?"] = False
+        self.update_market_registry(new_house)
         if old_house is not None:
             old_house.props["my_occupier"] = None
             old_house.props["rented_to"] = None
@@ -1543,7 +1826,7 @@ class HousingModel(abp.Model):
         if new_house.props["sale_price"] > buyer.props["capital"]:
             mortgage_temp = new_house.props["sale_price"] - buyer.props["capital"]
             buyer.props["capital"] = 0
-            repayment_temp = (mortgage_temp * self.interest_per_tick) / (1 - (1 + self.interest_per_tick) ** (- self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"]))
+            repayment_temp = (mortgage_temp * self.interest_per_tick) / self._annuity_factor
             # manage the mortgage and repayment parameters
             buyer.props["mortgage"].append(mortgage_temp)
             buyer.props["mortgage_initial"].append(mortgage_temp)
@@ -1555,7 +1838,7 @@ class HousingModel(abp.Model):
                 buyer.props["rate_duration"].append(random.randint(self.inputs["min_rate_duration_M"], self.inputs["max_rate_duration_M"]))
             else:
                 buyer.props["rate_duration"].append(random.randint(self.inputs["min_rate_duration_BTL"], self.inputs["max_rate_duration_BTL"]))
-            buyer.props["mortgage_duration"].append(self.inputs["mortgage_duration"] * self.inputs["ticks_per_year"])
+            buyer.props["mortgage_duration"].append(self._mortgage_ticks)
 
         # if sale price of new house is less than capital (i.e, buyer can pay in cash)
         else:
@@ -1581,13 +1864,25 @@ class HousingModel(abp.Model):
         mortgage_temp = seller.props["mortgage"][i]
         surplus = seller_house.props["sale_price"] - mortgage_temp
         seller.props["capital"] += surplus
-        del seller.props["mortgage"][i]
-        del seller.props["mortgage_initial"][i]
-        del seller.props["repayment"][i]
-        del seller.props["income_rent"][i]
-        del seller.props["rate"][i]
-        del seller.props["rate_duration"][i]
-        del seller.props["mortgage_duration"][i]
+        # the house itself is removed from my_ownership in manage_ownership_seller
+        self.drop_ownership_slot(seller, i, drop_house=False)
+
+    def drop_ownership_slot(self, owner:Household, i:int, drop_house:bool=True):
+        """
+        Remove one owned house and its finances from the parallel ownership lists of an owner (the order of the
+        remaining houses is kept, as the first house is the owner's home)
+
+        Parameters
+        ----------
+        owner: Household object
+        i: int
+            index of the house in the ownership lists of the owner
+        drop_house: bool, default=True
+            whether to also remove the house from my_ownership
+        """
+        if drop_house: del owner.props["my_ownership"][i]
+        for key in ("mortgage", "mortgage_initial", "mortgage_duration", "repayment", "income_rent", "rate", "rate_duration"):
+            del owner.props[key][i]
 
     def manage_surplus_tenant(self, tenant:Household):
         """
@@ -1611,18 +1906,59 @@ class HousingModel(abp.Model):
         """
         i = landlord.props["my_ownership"].index(landlord_house)
         landlord.props["income_rent"][i] = landlord_house.props["rent_price"]
-            
-
-
-
-            
-
-            
-
-
 
 
-
-
-
-            
+## batch runs of independent replications
+def run_replication(space, seed:int, n_ticks:int, inputs="default"):
+    """
+    Initialise and run one replication of the model with its own random seed
+
+    Parameters
+    ----------
+    space: geopandas object
+        the spatial map of the model (each replication works on its own copy)
+    seed: int
+        seed of the random and numpy random number generators
+    n_ticks: int
+        number of steps to run after the initialisation
+    inputs: dictionary or "default", default="default"
+        the model inputs
+
+    Return
+    ------
+    list of dictionaries with the monitors after every step
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    model = HousingModel(space.copy(), agents=list(), inputs=inputs)
+    model.initialise()
+    history = list()
+    for _ in range(n_ticks):
+        model.step()
+        history.append(asdict(model.monitors))
+    return history
+
+def run_batch(space, seeds:List[int], n_ticks:int, inputs="default", processes:int=None):
+    """
+    Run independent replications of the model in parallel (one process per replication)
+
+    Parameters
+    ----------
+    space: geopandas object
+        the spatial map of the model
+    seeds: list of int
+        one seed per replication
+    n_ticks: int
+        number of steps to run in each replication
+    inputs: dictionary or "default", default="default"
+        the model inputs (shared by all the replications)
+    processes: int, default=None
+        number of worker processes (all the available cores if None)
+
+    Return
+    ------
+    list with the monitors history of each replication (in the order of seeds)
+    """
+    jobs = [(space, seed, n_ticks, inputs) for seed in seeds]
+    with mp.Pool(processes) as pool:
+        return pool.starmap(run_replication, jobs)